@@ -9,6 +9,7 @@ import galsim
 import fitsio
 
 from .ps_psf import PowerSpectrumPSF
+from .galsim_utils import get_good_image_size
 from .masking import generate_bad_columns, generate_cosmic_rays
 from .interp import interpolate_image_and_noise
 from .cs_interp import interpolate_image_and_noise_cs
@@ -167,6 +168,10 @@ class End2EndSim(object):
             ngal_factor=None):
         self.rng = rng
         self.noise_rng = np.random.RandomState(seed=rng.randint(1, 2**32-1))
+        # used for the image noise fields so they can be drawn in place with
+        # a bit generator that is much faster than MT19937 for bulk draws
+        self._noise_field_rng = np.random.Generator(np.random.SFC64(
+            np.random.SeedSequence(self.noise_rng.randint(1, 2**32-1))))
         self.gal_type = gal_type
         self.psf_type = psf_type
         self.n_coadd = n_coadd
@@ -421,12 +426,12 @@ class End2EndSim(object):
 
             psf_obs = ngmix.Observation(
                 coadd_psf,
-                weight=0.0 * coadd_psf + 1.0 / self.noise[band]**2,
+                weight=np.full_like(coadd_psf, 1.0 / self.noise[band]**2),
                 jacobian=psf_jac)
 
             obs = ngmix.Observation(
                 coadd_im,
-                weight=0.0 * coadd_im + 1.0 / np.var(coadd_noise),
+                weight=np.full_like(coadd_im, 1.0 / np.var(coadd_noise)),
                 bmask=coadd_bmask,
                 ormask=coadd_bmask.copy(),
                 jacobian=obs_jac,
@@ -457,25 +462,22 @@ class End2EndSim(object):
             psf = self._get_psf_model(
                 band=band, epoch=epoch, x=pos.x, y=pos.y)
 
-            # draw with setup_only to get the image size
-            _im = galsim.Convolve(obj, psf).drawImage(
-                wcs=local_wcs,
-                method=method,
-                setup_only=True).array
-            assert _im.shape[0] == _im.shape[1]
+            # get the image size without a setup_only draw
+            conv = galsim.Convolve(obj, psf)
+            size = get_good_image_size(conv, local_wcs, method=method)
 
             # now get location of the stamp
-            x_ll = int(pos.x - (_im.shape[1] - 1)/2)
-            y_ll = int(pos.y - (_im.shape[0] - 1)/2)
+            x_ll = int(pos.x - (size - 1)/2)
+            y_ll = int(pos.y - (size - 1)/2)
 
             # get the offset of the center
-            dx = pos.x - (x_ll + (_im.shape[1] - 1)/2)
-            dy = pos.y - (y_ll + (_im.shape[0] - 1)/2)
+            dx = pos.x - (x_ll + (size - 1)/2)
+            dy = pos.y - (y_ll + (size - 1)/2)
 
-            # draw and set the proper origin
-            stamp = galsim.Convolve(obj, psf).drawImage(
-                nx=_im.shape[1],
-                ny=_im.shape[0],
+            # draw once with the sub-pixel offset and set the proper origin
+            stamp = conv.drawImage(
+                nx=size,
+                ny=size,
                 wcs=local_wcs,
                 offset=galsim.PositionD(x=dx, y=dy),
                 method=method)
@@ -493,9 +495,12 @@ class End2EndSim(object):
         coadd_wgts = []
         final_se_images = []
         for se_im in se_images:
-            se_im += self.noise_rng.normal(
-                scale=self.noise[band], size=se_im.shape)
-            se_nse = self.noise_rng.normal(size=se_im.shape) * self.noise[band]
+            se_nse = np.empty_like(se_im)
+            self._noise_field_rng.standard_normal(out=se_nse)
+            se_nse *= self.noise[band]
+            se_im += se_nse
+            self._noise_field_rng.standard_normal(out=se_nse)
+            se_nse *= self.noise[band]
 
             if self.mask_and_interp:
                 final_se_im, se_nse, bad_msk = self._mask_and_interp(
@@ -0,0 +1,27 @@
+import galsim
+
+
+def get_good_image_size(obj, wcs, method='auto'):
+    """Get the size of the image `obj.drawImage(wcs=wcs, method=method)`
+    would make, without setting up the image.
+
+    Parameters
+    ----------
+    obj : galsim.GSObject
+        The object to draw.
+    wcs : galsim.BaseWCS
+        A local WCS for the image.
+    method : str, optional
+        The method used to draw the object.
+
+    Returns
+    -------
+    size : int
+        The size of the square image.
+    """
+    # drawImage centers the profile of an unsized (even) image half a pixel
+    # down and left, which lowers stepk and so enlarges the image
+    prof = wcs.toImage(obj).shift(-0.5, -0.5)
+    if method in ('auto', 'fft', 'real_space'):
+        prof = galsim.Convolve(prof, galsim.Pixel(scale=1.0))
+    return prof.getGoodImageSize(1.0)
@@ -1,3 +1,6 @@
+import copy
+import functools
+
 import numpy as np
 import galsim
 import galsim.lensing_ps
@@ -5,6 +8,22 @@ import galsim.table
 import galsim.utilities
 
 
+@functools.lru_cache(maxsize=8)
+def _get_power_spectrum(trunc):
+    """Get the shape/magnification power spectrum for a truncation scale.
+
+    The returned object is shared, so callers must copy it before building
+    a grid.
+    """
+    # Heymans et al, 2012 found L0 ~= 3 arcmin, given as 180 arcsec here.
+    def _pf(k):
+        return (k**2 + (1./180)**2)**(-11./6.) * np.exp(-(k*trunc)**2)
+
+    return galsim.PowerSpectrum(
+        e_power_function=_pf,
+        b_power_function=_pf)
+
+
 class PowerSpectrumPSF(object):
     """Produce a spatially varying Moffat PSF according to the power spectrum
     given by Heymans et al. (2012).
@@ -38,6 +57,8 @@ class PowerSpectrumPSF(object):
     -------
     getPSF(pos)
         Get a PSF model at a given position.
+    getPSFs(x, y)
+        Get PSF models at arrays of positions.
     """
     def __init__(self, *,
                  rng, im_width, buff, scale, trunc=1,
@@ -48,18 +69,16 @@ class PowerSpectrumPSF(object):
         self._scale = scale
         self._tot_width = im_width + 2 * buff
         self._x_scale = 2.0 / self._tot_width / scale
+        # offset mapping zero-indexed pixels to arcsec from the image center
+        self._pos_offset = (1 - self._im_cen) * scale
         self._noise_level = noise_level
         self._buff = buff
         self._variation_factor = variation_factor
         self._median_seeing = median_seeing
 
         # set the power spectrum and PSF params
-        # Heymans et al, 2012 found L0 ~= 3 arcmin, given as 180 arcsec here.
-        def _pf(k):
-            return (k**2 + (1./180)**2)**(-11./6.) * np.exp(-(k*trunc)**2)
-        self._ps = galsim.PowerSpectrum(
-            e_power_function=_pf,
-            b_power_function=_pf)
+        # the copy keeps the grids from being shared between instances
+        self._ps = copy.copy(_get_power_spectrum(trunc))
         ng = 128
         gs = max(self._tot_width * self._scale / ng, 1)
         self.ng = ng
@@ -118,21 +137,47 @@ class PowerSpectrumPSF(object):
             self._lut_g2(pos_x, pos_y),
             self._lut_mu(pos_x, pos_y)+1)
 
-    def _get_atm(self, x, y):
-        xs = (x + 1 - self._im_cen) * self._scale
-        ys = (y + 1 - self._im_cen) * self._scale
+    def _get_atm_params(self, x, y):
+        """Get the shear and FWHM of the atmospheric PSF at arrays of
+        zero-indexed pixel positions."""
+        xs = np.atleast_1d(x) * self._scale + self._pos_offset
+        ys = np.atleast_1d(y) * self._scale + self._pos_offset
         g1, g2, mu = self._get_lensing((xs, ys))
+        g1 = np.array(g1, dtype=np.float64, ndmin=1)
+        g2 = np.array(g2, dtype=np.float64, ndmin=1)
+        mu = np.array(mu, dtype=np.float64, ndmin=1)
+
+        gsq = g1*g1 + g2*g2
+        msk = gsq >= 1.0
+        if np.any(msk):
+            norm = np.sqrt(gsq[msk]) / 0.5
+            g1[msk] /= norm
+            g2[msk] /= norm
 
-        if g1*g1 + g2*g2 >= 1.0:
-            norm = np.sqrt(g1*g1 + g2*g2) / 0.5
-            g1 /= norm
-            g2 /= norm
+        fwhm = self._fwhm_central * mu**-0.75
 
-        fwhm = self._fwhm_central / np.power(mu, 0.75)
+        return g1 + self._g1_mean, g2 + self._g2_mean, fwhm
+
+    def _get_atm(self, x, y):
+        g1, g2, fwhm = self._get_atm_params(x, y)
 
         psf = galsim.Moffat(
             beta=2.5,
-            fwhm=fwhm).shear(g1=g1 + self._g1_mean, g2=g2 + self._g2_mean)
+            fwhm=fwhm[0]).shear(g1=g1[0], g2=g2[0])
+
+        return psf
+
+    def _add_noise(self, psf, x, y):
+        if self._noise_level is not None and self._noise_level > 0:
+            xll = int(x + self._buff - 16)
+            yll = int(y + self._buff - 16)
+            assert xll >= 0 and xll+33 <= self._noise_field.shape[1]
+            assert yll >= 0 and yll+33 <= self._noise_field.shape[0]
+
+            stamp = self._noise_field[yll:yll+33, xll:xll+33].copy()
+            psf += galsim.InterpolatedImage(
+                galsim.ImageD(stamp, scale=self._scale),
+                normalization="sb")
 
         return psf
 
@@ -151,16 +196,37 @@ class PowerSpectrumPSF(object):
             A representation of the PSF as a galism object.
         """
         psf = self._get_atm(pos.x, pos.y)
+        return self._add_noise(psf, pos.x, pos.y)
 
-        if self._noise_level is not None and self._noise_level > 0:
-            xll = int(pos.x + self._buff - 16)
-            yll = int(pos.y + self._buff - 16)
-            assert xll >= 0 and xll+33 <= self._noise_field.shape[1]
-            assert yll >= 0 and yll+33 <= self._noise_field.shape[0]
+    def getPSFs(self, x, y):
+        """Get PSF models at many positions at once.
 
-            stamp = self._noise_field[yll:yll+33, xll:xll+33].copy()
-            psf += galsim.InterpolatedImage(
-                galsim.ImageD(stamp, scale=self._scale),
-                normalization="sb")
+        The PSF shapes and sizes are interpolated for all of the positions
+        in a single vectorized call.
 
-        return psf
+        Parameters
+        ----------
+        x : array-like
+            The column positions at which to compute the PSF. In zero-indexed
+            pixel coordinates.
+        y : array-like
+            The row positions at which to compute the PSF. In zero-indexed
+            pixel coordinates.
+
+        Returns
+        -------
+        psfs : list of galsim.GSObject
+            Representations of the PSF as galsim objects, one per position.
+        """
+        x = np.atleast_1d(x)
+        y = np.atleast_1d(y)
+        g1, g2, fwhm = self._get_atm_params(x, y)
+
+        psfs = []
+        for i in range(x.shape[0]):
+            psf = galsim.Moffat(
+                beta=2.5,
+                fwhm=fwhm[i]).shear(g1=g1[i], g2=g2[i])
+            psfs.append(self._add_noise(psf, x[i], y[i]))
+
+        return psfs
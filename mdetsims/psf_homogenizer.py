@@ -3,6 +3,35 @@ import numpy as np
 import galsim
 
 
+def get_psf_locations(image_shape, patch_size):
+    """Get the locations at which a `PSFHomogenizer` evaluates the PSF model.
+
+    Parameters
+    ----------
+    image_shape : list-like, length 2
+        The shape of the image to homogenize.
+    patch_size : int
+        The size in pixels of the patches used to process the image.
+
+    Returns
+    -------
+    locs : list of tuples
+        The (row, col) locations of the PSF evaluations.
+    """
+    ni = image_shape[0] // patch_size
+    nj = image_shape[1] // patch_size
+    dg = (patch_size - 1) / 2
+
+    locs = []
+    for i in range(ni+1):
+        row = min(i * patch_size + dg, image_shape[0])
+        for j in range(nj+1):
+            col = min(j * patch_size + dg, image_shape[1])
+            locs.append((row, col))
+
+    return locs
+
+
 class PSFHomogenizer(object):
     """Homogenize the PSF using GalSim.
 
@@ -98,7 +127,8 @@ class PSFHomogenizer(object):
 
                 patch = galsim.InterpolatedImage(
                     galsim.ImageD(pimage[row:row+tot_size,
-                                         col:col+tot_size].copy()),
+                                         col:col+tot_size].astype(
+                                             np.float64)),
                     wcs=galsim.PixelScale(1.0))
 
                 psf_im = self.psf_model(
@@ -178,41 +208,34 @@ class PSFHomogenizer(object):
         self._target_psf_image = None
         self._target_psf_size = None
         self._psf_im_shape = None
-        ni = self.image_shape[0] // self.patch_size
-        nj = self.image_shape[1] // self.patch_size
-        dg = (self.patch_size - 1) / 2
-
-        for i in range(ni+1):
-            row = min(i * self.patch_size + dg, self.image_shape[0])
-            for j in range(nj+1):
-                col = min(j * self.patch_size + dg, self.image_shape[1])
 
-                psf_im = self.psf_model(row, col)
-                psf_im /= np.sum(psf_im)
-                if self._psf_im_shape is None:
-                    self._psf_im_shape = psf_im.shape
-                    assert self._psf_im_shape[0] % 2 == 1
-                    assert self._psf_im_shape[1] % 2 == 1
-                    assert self._psf_im_shape[0] == self._psf_im_shape[1]
-                else:
-                    assert self._psf_im_shape == psf_im.shape
-
-                hsmpars = galsim.hsm.HSMParams(
-                    max_mom2_iter=1000)
-                gim = galsim.ImageD(psf_im, wcs=galsim.PixelScale(1))
-                try:
-                    moms = galsim.hsm.FindAdaptiveMom(gim, hsmparams=hsmpars)
-                    fac = gim.calculateFWHM() * (
-                        1.0 + 2.0 * np.sqrt(
-                            moms.observed_shape.g1**2 +
-                            moms.observed_shape.g2**2))
-                    if (self._target_psf_size is None or
-                            fac > self._target_psf_size):
-                        self._target_psf_size = fac
-                        self._target_psf_image = psf_im
-                        self._target_psf_loc = (row, col)
-                except galsim.errors.GalSimHSMError:
-                    pass
+        for row, col in get_psf_locations(self.image_shape, self.patch_size):
+            psf_im = self.psf_model(row, col)
+            psf_im /= np.sum(psf_im)
+            if self._psf_im_shape is None:
+                self._psf_im_shape = psf_im.shape
+                assert self._psf_im_shape[0] % 2 == 1
+                assert self._psf_im_shape[1] % 2 == 1
+                assert self._psf_im_shape[0] == self._psf_im_shape[1]
+            else:
+                assert self._psf_im_shape == psf_im.shape
+
+            hsmpars = galsim.hsm.HSMParams(
+                max_mom2_iter=1000)
+            gim = galsim.ImageD(psf_im, wcs=galsim.PixelScale(1))
+            try:
+                moms = galsim.hsm.FindAdaptiveMom(gim, hsmparams=hsmpars)
+                fac = gim.calculateFWHM() * (
+                    1.0 + 2.0 * np.sqrt(
+                        moms.observed_shape.g1**2 +
+                        moms.observed_shape.g2**2))
+                if (self._target_psf_size is None or
+                        fac > self._target_psf_size):
+                    self._target_psf_size = fac
+                    self._target_psf_image = psf_im
+                    self._target_psf_loc = (row, col)
+            except galsim.errors.GalSimHSMError:
+                pass
 
         # the final PSF is an interpolated image convolved with the Gaussian
         # smoothing kernel
@@ -1,6 +1,7 @@
 import logging
 import os
 import functools
+from concurrent.futures import ThreadPoolExecutor
 
 import numpy as np
 
@@ -9,8 +10,9 @@ import galsim
 import fitsio
 import scipy.spatial
 
-from .psf_homogenizer import PSFHomogenizer
+from .psf_homogenizer import PSFHomogenizer, get_psf_locations
 from .ps_psf import PowerSpectrumPSF
+from .galsim_utils import get_good_image_size
 from .masking import generate_bad_columns, generate_cosmic_rays
 from .interp import interpolate_image_and_noise
 from .cs_interp import interpolate_image_and_noise_cs
@@ -19,12 +21,21 @@ from .defaults import WLDEBLEND_DES_FACTOR, WLDEBLEND_LSST_FACTOR
 
 LOGGER = logging.getLogger(__name__)
 
-
 @functools.lru_cache(maxsize=8)
 def _cached_catalog_read(fname):
     return fitsio.read(fname)
 
 
+def _normalize_psf_image(psf_im):
+    """Normalize a PSF image to unit sum in place and return the sum of the
+    squares of the normalized image."""
+    tot = psf_im.sum()
+    sumsq = np.einsum('ij,ij->', psf_im, psf_im)
+    inv_tot = 1.0 / tot
+    psf_im *= inv_tot
+    return sumsq * inv_tot * inv_tot
+
+
 class Sim(object):
     """A simple simulation for metadetect testing.
 
@@ -121,6 +132,10 @@ class Sim(object):
         A factor to change the number density in the sims. It is set to 0.6
         automatically when using the wldeblend galaxy type for DES and 0.45
         when using this type for LSST.
+    n_threads : int, optional
+        The number of threads used to build the PSF-convolved galaxy objects.
+        All random draws are made before the objects are built, so the
+        results do not depend on this number. The default is 1.
 
     Methods
     -------
@@ -176,9 +191,14 @@ class Sim(object):
             pair_sim=False,
             bad_columns_kws=None,
             interpolation_type='cubic',
-            ngal_factor=None):
+            ngal_factor=None,
+            n_threads=1):
         self.rng = rng
         self.noise_rng = np.random.RandomState(seed=rng.randint(1, 2**32-1))
+        # used for the image noise fields so they can be drawn in place with
+        # a bit generator that is much faster than MT19937 for bulk draws
+        self._noise_field_rng = np.random.Generator(np.random.SFC64(
+            np.random.SeedSequence(self.noise_rng.randint(1, 2**32-1))))
         self.gal_type = gal_type
         self.psf_type = psf_type
         self.n_coadd = n_coadd
@@ -208,6 +228,7 @@ class Sim(object):
         self.pair_sim = pair_sim
         self.bad_columns_kws = bad_columns_kws or {}
         self.interpolation_type = interpolation_type
+        self.n_threads = n_threads
 
         self.area_sqr_arcmin = ((self.dim - 2*self.buff) * scale / 60)**2
 
@@ -217,6 +238,11 @@ class Sim(object):
         # typical pixel scale
         self.scale = scale
         self.wcs = galsim.PixelScale(self.scale)
+        # the local Jacobian of a uniform WCS is the same everywhere
+        if self.wcs.isUniform():
+            self._const_jac = self.wcs.jacobian()
+        else:
+            self._const_jac = None
 
         # frac of a single dimension that is used for drawing objects
         frac = 1.0 - self.buff * 2 / self.dim
@@ -241,6 +267,14 @@ class Sim(object):
             (self.dim * self.scale / 60 * frac)**2)
 
         self.shear_mat = galsim.Shear(g1=self.g1, g2=self.g2).getMatrix()
+        # plain floats so applying the shear avoids tiny matrix products
+        self._sm_a, self._sm_b, self._sm_c, self._sm_d = (
+            float(v) for v in self.shear_mat.ravel())
+
+        # rendered PSF at the image center, built on first use
+        self._psf_cen = None
+        # reused buffer for drawing PSF images, made once the size is known
+        self._psf_scratch = None
 
         if self.gal_grid is not None:
             self.nobj = self.gal_grid * self.gal_grid
@@ -369,51 +403,27 @@ class Sim(object):
         mbobs = ngmix.MultiBandObsList()
 
         truth_cat = np.zeros(len(positions), dtype=[('x', 'f8'), ('y', 'f8')])
+        truth_cat['x'] = [pos.x for pos in positions]
+        truth_cat['y'] = [pos.y for pos in positions]
 
         for band in range(self.n_bands):
 
-            im = galsim.ImageD(nrow=self.dim, ncol=self.dim, xmin=0, ymin=0)
-
-            band_objects = [o[band] for o in all_band_obj]
-            for obj_ind, (obj, pos) in enumerate(zip(band_objects, positions)):
-                truth_cat['x'][obj_ind] = pos.x
-                truth_cat['y'][obj_ind] = pos.y
-
-                # draw with setup_only to get the image size
-                _im = obj.drawImage(
-                    wcs=self.wcs,
-                    method=method,
-                    setup_only=True).array
-                assert _im.shape[0] == _im.shape[1]
-
-                # now get location of the stamp
-                x_ll = int(pos.x - (_im.shape[1] - 1)/2)
-                y_ll = int(pos.y - (_im.shape[0] - 1)/2)
-
-                # get the offset of the center
-                dx = pos.x - (x_ll + (_im.shape[1] - 1)/2)
-                dy = pos.y - (y_ll + (_im.shape[0] - 1)/2)
-                dx *= self.scale
-                dy *= self.scale
-
-                # draw and set the proper origin
-                stamp = obj.shift(dx=dx, dy=dy).drawImage(
-                    nx=_im.shape[1],
-                    ny=_im.shape[0],
-                    wcs=self.wcs,
-                    method=method)
-                stamp.setOrigin(x_ll, y_ll)
-
-                # intersect and add to total image
-                overlap = stamp.bounds & im.bounds
-                im[overlap] += stamp[overlap]
-
-            im = im.array.copy()
-
-            im += self.noise_rng.normal(scale=self.noise[band], size=im.shape)
-            wt = im*0 + 1.0/self.noise[band]**2
+            # the image and noise are carried in single precision and only
+            # converted when handed to ngmix
+            im = self._draw_scene(
+                band_objects=[o[band] for o in all_band_obj],
+                positions=positions,
+                method=method)
+
+            # the weight map is constant, so both noise fields are unit
+            # normal draws scaled by the noise level
+            noise = np.empty_like(im)
+            self._noise_field_rng.standard_normal(out=noise, dtype=np.float32)
+            noise *= self.noise[band]
+            im += noise
             bmask = np.zeros(im.shape, dtype='i4')
-            noise = self.noise_rng.normal(size=im.shape) / np.sqrt(wt)
+            self._noise_field_rng.standard_normal(out=noise, dtype=np.float32)
+            noise *= self.noise[band]
 
             if self.mask_and_interp:
                 im, noise, bmask = self._mask_and_interp(im, noise)
@@ -433,14 +443,17 @@ class Sim(object):
                 col=self.im_cen,
                 wcs=galsim_jac)
 
+            # the weight map is built directly at the precision ngmix uses
+            wt = np.full(im.shape, 1.0/(self.noise[band]*self.noise[band]))
+
             obs = ngmix.Observation(
-                im,
+                im.astype(np.float64),
                 weight=wt,
                 bmask=bmask,
                 ormask=bmask.copy(),
                 jacobian=jac,
                 psf=psf_obs,
-                noise=noise)
+                noise=noise.astype(np.float64))
 
             obslist = ngmix.ObsList()
             obslist.append(obs)
@@ -451,6 +464,48 @@ class Sim(object):
         else:
             return mbobs
 
+    def _draw_scene(self, *, band_objects, positions, method,
+                    dtype=np.float32):
+        """Draw all of the objects in one band into an image.
+
+        Returns
+        -------
+        im : np.ndarray
+            The image of the scene.
+        """
+        # galsim draws straight into this array, so no copy is needed after
+        scene_arr = np.zeros((self.dim, self.dim), dtype=dtype)
+        im = galsim.Image(scene_arr, xmin=0, ymin=0)
+
+        # a full-scene FFT needs the k-space resolution of the widest object
+        # over the whole image, so separate stamps are much faster
+        for obj, pos in zip(band_objects, positions):
+            size = get_good_image_size(obj, self.wcs, method=method)
+
+            # now get location of the stamp
+            x_ll = int(pos.x - (size - 1)/2)
+            y_ll = int(pos.y - (size - 1)/2)
+
+            # get the offset of the center
+            dx = pos.x - (x_ll + (size - 1)/2)
+            dy = pos.y - (y_ll + (size - 1)/2)
+
+            # draw once with the sub-pixel offset and set the proper origin
+            stamp = obj.drawImage(
+                nx=size,
+                ny=size,
+                wcs=self.wcs,
+                offset=galsim.PositionD(x=dx, y=dy),
+                method=method,
+                dtype=dtype)
+            stamp.setOrigin(x_ll, y_ll)
+
+            # intersect and add to total image
+            overlap = stamp.bounds & im.bounds
+            im[overlap] += stamp[overlap]
+
+        return scene_arr
+
     def _mask_and_interp(self, image, noise):
         LOGGER.debug('applying masking and interpolation')
 
@@ -497,13 +552,23 @@ class Sim(object):
     def _homogenize_psf(self, im, noise, band):
         LOGGER.info('applying PSF homogenization')
 
+        patch_size = 25
+
+        # render all of the PSF images the homogenizer needs at once
+        if not hasattr(self, '_hmg_psf_images'):
+            locs = get_psf_locations(im.shape, patch_size)
+            psf_ims = self._render_psf_images_batch(
+                x=np.array([col for _, col in locs]),
+                y=np.array([row for row, _ in locs]))
+            self._hmg_psf_images = [
+                dict(zip(locs, psf_ims[i])) for i in range(self.n_bands)]
+
         def _func(row, col):
-            psf_im, _, _, _, _ = self._render_psf_image(
-                x=col,
-                y=row)
-            return psf_im[band]
+            # the homogenizer normalizes the images in place
+            return self._hmg_psf_images[band][(row, col)].copy()
 
-        hmg = PSFHomogenizer(_func, im.shape, patch_size=25, sigma=0.25)
+        hmg = PSFHomogenizer(
+            _func, im.shape, patch_size=patch_size, sigma=0.25)
         him = hmg.homogenize_image(im)
         hnoise = hmg.homogenize_image(noise)
         psf_img = hmg.get_target_psf()
@@ -511,6 +576,8 @@ class Sim(object):
         return him, hnoise, psf_img
 
     def _get_local_jacobian(self, *, x, y):
+        if self._const_jac is not None:
+            return self._const_jac
         return self.wcs.jacobian(
             image_pos=galsim.PositionD(x=x+1, y=y+1))
 
@@ -565,13 +632,10 @@ class Sim(object):
 
         return _gal
 
-    def _get_gal_ground_galsim_parametric(self):
-        if not hasattr(self, '_cosmo_cat'):
-            self._cosmo_cat = galsim.COSMOSCatalog(sample='25.2')
-        angle = self.rng.uniform() * 360
+    def _get_gal_ground_galsim_parametric(self, *, index, angle):
         gal = self._cosmo_cat.makeGalaxy(
-            gal_type='parametric',
-            rng=self._galsim_rng
+            index=index,
+            gal_type='parametric'
         ).rotate(
             angle * galsim.degrees
         ).withScaledFlux(
@@ -581,10 +645,7 @@ class Sim(object):
         )
         return [gal for _ in range(self.n_bands)]
 
-    def _get_gal_wldeblend(self):
-        rind = self.rng.choice(self._wldeblend_cat.size)
-        angle = self.rng.uniform() * 360
-
+    def _get_gal_wldeblend(self, *, rind, angle):
         gals = [
             self._builders[band].from_catalog(
                 self._wldeblend_cat[rind], 0, 0,
@@ -594,6 +655,28 @@ class Sim(object):
 
         return gals
 
+    def _draw_gal_kws(self):
+        """Draw the random parameters for one galaxy.
+
+        These are drawn separately from building the galaxy so that the
+        galaxies can be built in any order.
+        """
+        if self.gal_type == 'exp':
+            return {}
+        elif self.gal_type == 'ground_galsim_parametric':
+            if not hasattr(self, '_cosmo_cat'):
+                self._cosmo_cat = galsim.COSMOSCatalog(sample='25.2')
+            angle = self.rng.uniform() * 360
+            index = self._cosmo_cat.selectRandomIndex(
+                1, rng=self._galsim_rng)
+            return {'index': index, 'angle': angle}
+        elif self.gal_type == 'wldeblend':
+            rind = self.rng.choice(self._wldeblend_cat.size)
+            angle = self.rng.uniform() * 360
+            return {'rind': rind, 'angle': angle}
+        else:
+            raise ValueError('gal_type "%s" not valid!' % self.gal_type)
+
     def _get_band_objects(self):
         """Get a list of effective PSF-convolved galsim images w/ their
         offsets in the image.
@@ -605,9 +688,6 @@ class Sim(object):
         positions : list of galsim.PositionD
             A list of galsim positions for each object.
         """
-        all_band_obj = []
-        positions = []
-
         nobj = self._get_nobj()
         if self.gal_grid is not None:
             self._gal_grid_ind = 0
@@ -619,11 +699,13 @@ class Sim(object):
 
         dx, dy = self._get_dxdy()
 
+        dxdys = []
+        all_gal_kws = []
         for i in range(nobj):
             if self.pair_sim: 
                 if i != 0:
-                    dx *= -1
-                    dy *= -1
+                    dx = -dx
+                    dy = -dy
             else:
                 # unsheared offset from center of image
                 if 'min_dist' in gal_kws:
@@ -636,31 +718,42 @@ class Sim(object):
                     others.append([dx, dy])
                 else:
                      dx, dy = self._get_dxdy()
-                # changed
-                # get the galaxy
+            dxdys.append([dx, dy])
+
+            # the galaxy parameters are drawn right after each offset and
+            # the power spectrum PSFs are seeded right after the first
+            # object, which keeps the RNG stream the same as building each
+            # object in turn
+            all_gal_kws.append(self._draw_gal_kws())
+            if i == 0 and self.psf_type == 'ps':
+                self._init_ps_psfs(**(self.psf_kws or {}))
+        dxdys = np.array(dxdys, dtype=np.float64).reshape(nobj, 2)
+
+        # compute the final image positions
+        dx = dxdys[:, 0]
+        dy = dxdys[:, 1]
+        if self.shear_scene:
+            sdx = self._sm_a * dx + self._sm_b * dy
+            sdy = self._sm_c * dx + self._sm_d * dy
+        else:
+            sdx = dx
+            sdy = dy
+
+        xs = sdx / self.scale + self.im_cen
+        ys = sdy / self.scale + self.im_cen
+        positions = [galsim.PositionD(x=x, y=y) for x, y in zip(xs, ys)]
+
+        # get the PSF info for all of the objects at once
+        all_psfs = self._get_object_psfs(positions)
+
+        def _make_one(gal_kws, _psfs):
+            # get the galaxy
             if self.gal_type == 'exp':
                 gals = self._get_gal_exp()
             elif self.gal_type == 'ground_galsim_parametric':
-                gals = self._get_gal_ground_galsim_parametric()
+                gals = self._get_gal_ground_galsim_parametric(**gal_kws)
             elif self.gal_type == 'wldeblend':
-                gals = self._get_gal_wldeblend()
-            else:
-                raise ValueError('gal_type "%s" not valid!' % self.gal_type)
-
-            # compute the final image position
-            if self.shear_scene:
-                sdx, sdy = np.dot(self.shear_mat, np.array([dx, dy]))
-            else:
-                sdx = dx
-                sdy = dy
-
-            pos = galsim.PositionD(
-                x=sdx / self.scale + self.im_cen,
-                y=sdy / self.scale + self.im_cen)
-
-            # get the PSF info
-            _, _psf_wcs, _, _psfs, _ = self._render_psf_image(
-                x=pos.x, y=pos.y)
+                gals = self._get_gal_wldeblend(**gal_kws)
 
             # shear, shift, and then convolve the galaxy
             _obj = []
@@ -669,17 +762,53 @@ class Sim(object):
                 gal = galsim.Convolve(gal, _psf)
                 _obj.append(gal)
 
-            all_band_obj.append(_obj)
-            positions.append(pos)
+            return _obj
+
+        if self.gal_type == 'exp' and self.psf_type == 'gauss':
+            # every object is the same convolved profile, so build it once
+            # and draw each copy at its own position in the scene
+            if nobj > 0:
+                all_band_obj = [_make_one(all_gal_kws[0], all_psfs[0])] * nobj
+            else:
+                all_band_obj = []
+        elif self.n_threads > 1 and nobj > 1:
+            with ThreadPoolExecutor(max_workers=self.n_threads) as ex:
+                all_band_obj = list(ex.map(_make_one, all_gal_kws, all_psfs))
+        else:
+            all_band_obj = [
+                _make_one(gal_kws, _psfs)
+                for gal_kws, _psfs in zip(all_gal_kws, all_psfs)]
 
         return all_band_obj, positions
 
+    def _get_object_psfs(self, positions):
+        """Get the PSF models for convolving objects at a list of positions.
+
+        The gaussian and wldeblend PSFs do not vary across the image, so
+        they are built once. Power spectrum PSFs for all of the positions
+        are built in a single vectorized call.
+
+        Returns
+        -------
+        all_psfs : list of lists
+            A list of the PSF models in each band for each position.
+        """
+        if self.psf_type == 'ps':
+            kws = self.psf_kws or {}
+            return self._get_ps_psf_models(
+                x=np.array([pos.x for pos in positions]),
+                y=np.array([pos.y for pos in positions]),
+                **kws)
+
+        _, _, _, _psfs, _ = self._render_psf_image(
+            x=self.im_cen, y=self.im_cen)
+        return [_psfs] * len(positions)
+
     def _get_psf_box_size(self, psfs, _psf_wcs):
         if not hasattr(self, '_cached_psf_box_size'):
             max_box_size = -1
             for psf in psfs:
-                psf_im = psf.drawImage(wcs=_psf_wcs, setup_only=True).array
-                _box_size = np.max(psf_im.shape)
+                _box_size = get_good_image_size(psf, _psf_wcs)
                 if _box_size % 2 == 0:
                     _box_size += 1
                 if _box_size > max_box_size:
@@ -689,7 +818,7 @@ class Sim(object):
 
         return self._cached_psf_box_size
 
-    def _stack_ps_psfs(self, *, x, y, **kwargs):
+    def _init_ps_psfs(self, **kwargs):
         if not hasattr(self, '_psfs'):
             self._psfs = [[
                     PowerSpectrumPSF(
@@ -703,30 +832,45 @@ class Sim(object):
 
             LOGGER.debug('stacking %d power spectrum psfs', self.n_coadd_psf)
 
-        _psf_wcs = self._get_local_jacobian(x=x, y=y)
+    def _get_ps_psf_models(self, *, x, y, **kwargs):
+        """Get the stacked power spectrum PSF models at arrays of positions.
+
+        Returns
+        -------
+        all_psfs : list of lists
+            A list of the PSF models in each band for each position.
+        """
+        self._init_ps_psfs(**kwargs)
 
-        test_psfs = []
+        band_psfs = []
         for i in range(self.n_bands):
-            test_psfs += [
-                p.getPSF(galsim.PositionD(x=x, y=y))
-                for p in self._psfs[i]]
+            comp_psfs = [p.getPSFs(x, y) for p in self._psfs[i]]
+            band_psfs.append([
+                galsim.Sum(list(_comps)).withFlux(1)
+                for _comps in zip(*comp_psfs)])
 
-        psf_dim = self._get_psf_box_size(test_psfs, _psf_wcs)
+        return [list(_psfs) for _psfs in zip(*band_psfs)]
 
-        psfs = []
-        psf_ims = []
-        for i in range(self.n_bands):
-            psf = galsim.Sum([
-                p.getPSF(galsim.PositionD(x=x, y=y))
-                for p in self._psfs[i]]).withFlux(1)
-            psf_im = psf.drawImage(
-                nx=psf_dim, ny=psf_dim, wcs=_psf_wcs).array.copy()
-            psf_im /= np.sum(psf_im)
-
-            psfs.append(psf)
-            psf_ims.append(psf_im)
+    def _stack_ps_psfs(self, *, x, y, **kwargs):
+        self._init_ps_psfs(**kwargs)
 
-        return psfs, psf_ims
+        _psf_wcs = self._get_local_jacobian(x=x, y=y)
+
+        band_psfs = [
+            [p.getPSF(galsim.PositionD(x=x, y=y)) for p in self._psfs[i]]
+            for i in range(self.n_bands)]
+
+        psf_dim = self._get_psf_box_size(
+            [p for _psfs in band_psfs for p in _psfs], _psf_wcs)
+
+        psfs = [galsim.Sum(_psfs).withFlux(1) for _psfs in band_psfs]
+
+        # draw each stacked model straight into its slice of the output
+        psf_ims = np.zeros((self.n_bands, psf_dim, psf_dim))
+        for psf, psf_im in zip(psfs, psf_ims):
+            psf.drawImage(image=galsim.ImageD(psf_im), wcs=_psf_wcs)
+
+        return psfs, list(psf_ims)
 
     def _get_wldeblend_psfs(self, *, x, y):
         _psf_wcs = self._get_local_jacobian(x=x, y=y)
@@ -738,13 +882,20 @@ class Sim(object):
         psf_ims = []
         for i in range(len(self._surveys)):
             psfs.append(self._surveys[i].psf_model)
-            psf_im = psfs[-1].drawImage(
-                nx=psf_dim, ny=psf_dim, wcs=_psf_wcs).array.copy()
-            psf_im /= np.sum(psf_im)
+            psf_im = self._draw_psf_image(psfs[-1], psf_dim, _psf_wcs)
             psf_ims.append(psf_im)
 
         return psfs, psf_ims
 
+    def _draw_psf_image(self, psf, psf_dim, _psf_wcs):
+        """Draw a PSF image into the reused scratch image and return a copy
+        of the pixels."""
+        if (self._psf_scratch is None or
+                self._psf_scratch.array.shape != (psf_dim, psf_dim)):
+            self._psf_scratch = galsim.ImageD(psf_dim, psf_dim)
+        psf.drawImage(image=self._psf_scratch, wcs=_psf_wcs)
+        return self._psf_scratch.array.copy()
+
     def _render_psf_image(self, *, x, y):
         """Render the PSF image.
 
@@ -761,6 +912,15 @@ class Sim(object):
         method : str
             Method to use to render images using this PSF.
         """
+        # the image center is rendered for every band of every call to
+        # get_mbobs, so we draw it once and hand out copies
+        is_cen = (x == self.im_cen and y == self.im_cen)
+        if is_cen and self._psf_cen is not None:
+            psf_ims, _psf_wcs, target_noises, psfs, method = self._psf_cen
+            return (
+                [psf_im.copy() for psf_im in psf_ims], _psf_wcs,
+                target_noises.copy(), psfs, method)
+
         _psf_wcs = self._get_local_jacobian(x=x, y=y)
 
         if self.psf_type == 'gauss':
@@ -769,9 +929,7 @@ class Sim(object):
             LOGGER.debug('gaussian PSF FWHM is %f', fwhm)
             psf = galsim.Gaussian(fwhm=fwhm)
             psf_dim = self._get_psf_box_size([psf], _psf_wcs)
-            psf_im = psf.drawImage(
-                nx=psf_dim, ny=psf_dim, wcs=_psf_wcs).array.copy()
-            psf_im /= np.sum(psf_im)
+            psf_im = self._draw_psf_image(psf, psf_dim, _psf_wcs)
             method = 'auto'
             psf_ims = [psf_im] * self.n_bands
             psfs = [psf] * self.n_bands
@@ -786,13 +944,57 @@ class Sim(object):
         else:
             raise ValueError('psf_type "%s" not valid!' % self.psf_type)
 
-        # set the signal to noise to about 500
+        # normalize the images and set the signal to noise to about 500
+        # normalizing is idempotent, so images shared by bands are fine
         target_s2n = 500.0
         target_noises = np.sqrt(
-            [np.sum(psf_im ** 2) for psf_im in psf_ims]) / target_s2n
+            [_normalize_psf_image(psf_im) for psf_im in psf_ims]) / target_s2n
+
+        if is_cen:
+            self._psf_cen = (psf_ims, _psf_wcs, target_noises, psfs, method)
+            return (
+                [psf_im.copy() for psf_im in psf_ims], _psf_wcs,
+                target_noises.copy(), psfs, method)
 
         return psf_ims, _psf_wcs, target_noises, psfs, method
 
+    def _render_psf_images_batch(self, *, x, y):
+        """Render the normalized PSF images at arrays of positions.
+
+        Returns
+        -------
+        psf_images : np.ndarray, shape (n_bands, len(x), dim, dim)
+            The pixel-convolved (i.e. effective) PSF images.
+        """
+        x = np.atleast_1d(x)
+        y = np.atleast_1d(y)
+
+        if self.psf_type != 'ps':
+            # these PSFs do not vary across the image
+            psf_ims, _, _, _, _ = self._render_psf_image(x=x[0], y=y[0])
+            return np.repeat(
+                np.array(psf_ims)[:, np.newaxis], x.shape[0], axis=1)
+
+        # make sure the PSFs and their box size are set
+        if not hasattr(self, '_cached_psf_box_size'):
+            self._render_psf_image(x=self.im_cen, y=self.im_cen)
+        psf_dim = self._cached_psf_box_size
+
+        # the WCS is a constant pixel scale, so one Jacobian works everywhere
+        _psf_wcs = self._get_local_jacobian(x=self.im_cen, y=self.im_cen)
+
+        kws = self.psf_kws or {}
+        all_psfs = self._get_ps_psf_models(x=x, y=y, **kws)
+
+        # draw each stacked model straight into its slice of the output
+        psf_ims = np.zeros((self.n_bands, x.shape[0], psf_dim, psf_dim))
+        for j, _psfs in enumerate(all_psfs):
+            for i, psf in enumerate(_psfs):
+                psf.drawImage(image=galsim.ImageD(psf_ims[i, j]), wcs=_psf_wcs)
+        psf_ims /= np.sum(psf_ims, axis=(2, 3), keepdims=True)
+
+        return psf_ims
+
     def get_psf_obs(self, *, x, y, band):
         """Get an ngmix Observation of the PSF at a position.
 
@@ -813,7 +1015,8 @@ class Sim(object):
         psf_images, psf_wcs, noises, _, _ = self._render_psf_image(
             x=x, y=y)
 
-        weight = np.zeros_like(psf_images[band]) + 1.0/noises[band]**2
+        weight = np.full_like(
+            psf_images[band], 1.0/(noises[band]*noises[band]))
 
         cen = (np.array(psf_images[band].shape) - 1.0)/2.0
         j = ngmix.jacobian.Jacobian(
@@ -0,0 +1,24 @@
+import galsim
+
+import pytest
+
+from ..galsim_utils import get_good_image_size
+
+PIXEL_SCALE = 0.263
+
+
+@pytest.mark.parametrize('method', ['auto', 'no_pixel'])
+@pytest.mark.parametrize('wcs', [
+    galsim.JacobianWCS(PIXEL_SCALE, 0, 0, PIXEL_SCALE),
+    galsim.JacobianWCS(0.26, 0.01, -0.02, 0.25)])
+@pytest.mark.parametrize('obj', [
+    galsim.Gaussian(fwhm=0.9),
+    galsim.Moffat(beta=2.5, fwhm=0.8).shear(g1=0.05, g2=0.01),
+    galsim.Convolve(
+        galsim.Exponential(half_light_radius=0.5).shear(g1=0.2, g2=-0.1),
+        galsim.Moffat(beta=2.5, fwhm=0.9))])
+def test_get_good_image_size(method, wcs, obj):
+    im = obj.drawImage(wcs=wcs, method=method, setup_only=True)
+
+    assert im.array.shape == (
+        get_good_image_size(obj, wcs, method=method),) * 2
@@ -118,3 +118,25 @@ def test_ps_psf_truncation(noise_level):
 
     assert np.std(g1s1) > np.std(g1s2)
     assert np.std(g2s1) > np.std(g2s2)
+
+
+@pytest.mark.parametrize('noise_level', [None, 0, 1e-3])
+def test_ps_psf_get_psfs(noise_level):
+    ps = PowerSpectrumPSF(
+        rng=np.random.RandomState(seed=10),
+        im_width=120,
+        buff=20,
+        scale=PIXEL_SCALE,
+        trunc=1,
+        noise_level=noise_level)
+
+    xs = np.array([0, 10, 57.5, 119])
+    ys = np.array([3, 100, 57.5, 0])
+    psfs = ps.getPSFs(xs, ys)
+    assert len(psfs) == len(xs)
+
+    for x, y, psf in zip(xs, ys, psfs):
+        psf_im = psf.drawImage(nx=33, ny=33, scale=PIXEL_SCALE)
+        _psf_im = ps.getPSF(galsim.PositionD(x=x, y=y)).drawImage(
+            nx=33, ny=33, scale=PIXEL_SCALE)
+        assert np.allclose(psf_im.array, _psf_im.array)
@@ -1,7 +1,7 @@
 import galsim
 import numpy as np
 
-from ..psf_homogenizer import PSFHomogenizer
+from ..psf_homogenizer import PSFHomogenizer, get_psf_locations
 
 SCALE = 0.25
 PSF_FAC = 0.95
@@ -43,3 +43,24 @@ def test_gaussian_smoke():
 
     assert max_diff_orig > 1e-2
     assert max_diff_hmg < max_diff_orig / 10
+
+
+def test_get_psf_locations():
+    locs = set(get_psf_locations([60, 60], 15))
+    seen = set()
+
+    def psf_model(row, col):
+        seen.add((row, col))
+        return galsim.Gaussian(fwhm=1.0).drawImage(
+            scale=SCALE, nx=33, ny=33).array
+
+    # the target PSF is built at construction from the patch locations
+    hpsf = PSFHomogenizer(psf_model, [60, 60], patch_size=15)
+    assert seen == locs
+
+    # and the patches are homogenized with PSFs from those locations too
+    seen.clear()
+    hpsf.homogenize_image(
+        np.random.RandomState(seed=10).normal(size=(60, 60)))
+    assert len(seen) > 0
+    assert seen <= locs
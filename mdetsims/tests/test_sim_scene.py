@@ -0,0 +1,99 @@
+import numpy as np
+
+import pytest
+
+from ..sim_utils import Sim
+
+PIXEL_SCALE = 0.263
+
+
+@pytest.mark.parametrize('psf_type', ['gauss', 'ps'])
+def test_sim_scene_single_precision(psf_type):
+    s = Sim(
+        rng=np.random.RandomState(seed=10),
+        gal_type='exp',
+        psf_type=psf_type,
+        n_coadd=10,
+        scale=PIXEL_SCALE)
+
+    all_band_obj, positions = s._get_band_objects()
+    _, _, _, _, method = s._render_psf_image(x=s.im_cen, y=s.im_cen)
+    band_objects = [o[0] for o in all_band_obj]
+
+    im32 = s._draw_scene(
+        band_objects=band_objects, positions=positions, method=method)
+    im64 = s._draw_scene(
+        band_objects=band_objects, positions=positions, method=method,
+        dtype=np.float64)
+
+    assert im32.dtype == np.float32
+    assert np.max(im64) > 0
+    # the rounding errors should be far below the noise
+    assert np.max(np.abs(im32 - im64)) < 1e-3 * s.noise[0]
+
+
+def test_sim_scene_obs_dtypes():
+    s = Sim(
+        rng=np.random.RandomState(seed=10),
+        gal_type='exp',
+        psf_type='gauss',
+        n_coadd=10,
+        scale=PIXEL_SCALE)
+    obs = s.get_mbobs()[0][0]
+
+    assert obs.image.dtype == np.float64
+    assert obs.weight.dtype == np.float64
+    assert obs.noise.dtype == np.float64
+    assert np.allclose(obs.weight, 1.0 / s.noise[0]**2)
+
+
+def test_sim_scene_ps_psf_images():
+    s = Sim(
+        rng=np.random.RandomState(seed=10),
+        gal_type='exp',
+        psf_type='ps',
+        n_coadd=10,
+        scale=PIXEL_SCALE)
+    psf_ims, psf_wcs, _, psfs, _ = s._render_psf_image(x=10.5, y=140)
+    xs = np.array([10.5, s.im_cen, 200])
+    ys = np.array([140, s.im_cen, 3])
+    batch_psf_ims = s._render_psf_images_batch(x=xs, y=ys)
+
+    # the images have to be renderings of the stacked models that the
+    # objects are convolved with
+    for band in range(s.n_bands):
+        dim = psf_ims[band].shape[0]
+        im = psfs[band].drawImage(
+            nx=dim, ny=dim, wcs=psf_wcs, dtype=np.float64).array
+        im /= np.sum(im)
+        assert np.allclose(psf_ims[band], im, rtol=0, atol=1e-12)
+        assert np.allclose(batch_psf_ims[band, 0], im, rtol=0, atol=1e-12)
+
+        for i, (x, y) in enumerate(zip(xs, ys)):
+            _psf_ims, _, _, _, _ = s._render_psf_image(x=x, y=y)
+            assert np.allclose(
+                batch_psf_ims[band, i], _psf_ims[band], rtol=0, atol=1e-12)
+
+
+@pytest.mark.parametrize('psf_type', ['gauss', 'ps'])
+def test_sim_scene_psf_cen_cache(psf_type):
+    s = Sim(
+        rng=np.random.RandomState(seed=10),
+        gal_type='exp',
+        psf_type=psf_type,
+        n_coadd=10,
+        scale=PIXEL_SCALE)
+    psf_ims, _, noises, _, _ = s._render_psf_image(x=s.im_cen, y=s.im_cen)
+    _psf_ims = [psf_im.copy() for psf_im in psf_ims]
+    _noises = noises.copy()
+
+    # callers own what they get back, so changing it must not leak into
+    # later renderings of the center
+    for psf_im in psf_ims:
+        psf_im *= 2
+    noises *= 2
+
+    psf_ims, _, noises, _, _ = s._render_psf_image(x=s.im_cen, y=s.im_cen)
+    for psf_im, _psf_im in zip(psf_ims, _psf_ims):
+        assert np.array_equal(psf_im, _psf_im)
+    assert np.array_equal(noises, _noises)
@@ -108,3 +108,41 @@ def test_sim_seeding_shears(
     assert not np.array_equal(mbobs1[0][0].image, mbobs2[0][0].image)
     assert np.array_equal(mbobs1[0][0].noise, mbobs2[0][0].noise)
     assert np.array_equal(mbobs1[0][0].psf.image, mbobs2[0][0].psf.image)
+
+
+@pytest.mark.parametrize('gal_type', ['exp'])
+@pytest.mark.parametrize('psf_type', ['ps'])
+@pytest.mark.parametrize('homogenize_psf', [False, True])
+@pytest.mark.parametrize('n_coadd_psf', [1, 3])
+def test_sim_seeding_threads(
+        gal_type, psf_type, homogenize_psf, n_coadd_psf):
+
+    s1 = Sim(
+        rng=np.random.RandomState(seed=10),
+        gal_type=gal_type,
+        psf_type=psf_type,
+        homogenize_psf=homogenize_psf,
+        n_coadd_psf=n_coadd_psf,
+        n_coadd=10,
+        scale=PIXEL_SCALE,
+        n_threads=1)
+
+    s2 = Sim(
+        rng=np.random.RandomState(seed=10),
+        gal_type=gal_type,
+        psf_type=psf_type,
+        homogenize_psf=homogenize_psf,
+        n_coadd_psf=n_coadd_psf,
+        n_coadd=10,
+        scale=PIXEL_SCALE,
+        n_threads=4)
+
+    mbobs1 = s1.get_mbobs()
+    mbobs2 = s2.get_mbobs()
+
+    for band in range(len(mbobs1)):
+        obs1 = mbobs1[band][0]
+        obs2 = mbobs2[band][0]
+        assert np.array_equal(obs1.image, obs2.image)
+        assert np.array_equal(obs1.noise, obs2.noise)
+        assert np.array_equal(obs1.psf.image, obs2.psf.image)